@@ -2,7 +2,9 @@ param (
     [Parameter(Mandatory = $true, Position = 0)]
     [string]$Command,
     [Parameter(Mandatory = $false, Position = 1)]
-    [string]$Language
+    [string]$Language,
+    [Parameter(Mandatory = $false, ValueFromRemainingArguments = $true)]
+    [string[]]$ExtraArgs
 )
 
 $ErrorActionPreference = "Stop"
@@ -289,7 +291,8 @@ function Show-Help {
     Write-Host "  test <lang|all>       Run tests for one binding or all bindings"
     Write-Host "  bootstrap <lang|all>  Run setup, build, and test in sequence"
     Write-Host "  clean <lang|all>      Clean artifacts"
-    Write-Host "  audit                 Run the final audit report generator"
+    Write-Host "  audit [--fail-fast] [--no-setup-cache]"
+    Write-Host "                        Run the final audit report generator"
     Write-Host "  cache-dir <lang>      Print cache directory path"
     Write-Host "  lockfile <lang>       Print cache key lockfile"
     Write-Host "  list                  List all bindings and tool status"
@@ -363,7 +366,9 @@ switch ($Command) {
         }
         Push-Location $PSScriptRoot
         try {
-            & $pythonCommand "tooling/audit_omega.py"
+            # Audit flags land in $Language/$ExtraArgs; pass them through
+            $auditArgs = @(@($Language) + @($ExtraArgs) | Where-Object { $_ })
+            & $pythonCommand "tooling/audit_omega.py" $auditArgs
             exit $LASTEXITCODE
         }
         finally {
@@ -1,14 +1,38 @@
+import argparse
+import hashlib
 import json
 import os
 import subprocess
 import re
+import signal
 import sys
-from typing import Optional, Tuple, List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Optional, Tuple, List, Dict, Any, Union
+
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 # Configuration
 TOOLCHAIN_PATH = "toolchain.json"
 REPORT_PATH = os.path.join("docs", "generated", "FINAL_AUDIT_REPORT.md")
+SETUP_CACHE_PATH = ".audit_cache.json"
 STRLING_CLI = "./strling"
+CERTIFIED = "🟢 CERTIFIED"
+# Read size used when streaming subprocess output
+STREAM_CHUNK_SIZE = 1 << 16
+ABORT_POLL_INTERVAL = 0.1
+
+
+_print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    # Bindings are processed in worker threads; keep each message contiguous
+    with _print_lock:
+        print(message, flush=True)
 
 
 def print_instructional_failure():
@@ -25,18 +49,68 @@ def print_instructional_failure():
     print("=" * 60 + "\n")
 
 
+# Skip/warning patterns are matched line by line; MULTILINE keeps "^" anchored
+# to line starts when a search is bounded to a single line of the full log.
+# They are case-insensitive, but rather than IGNORECASE (which defeats the
+# regex engine's literal fast path) they are case-folded and matched against
+# lowercased output.
+LINE_FLAGS = re.MULTILINE
+
+
+def compile_bytes(pattern: str, flags: int = 0) -> "re.Pattern[bytes]":
+    # Subprocess output is scanned as raw bytes; every pattern is ASCII.
+    # When google-re2 is installed it runs the scans in linear time without
+    # backtracking. It only takes inline flags, and a pattern it rejects
+    # stays on `re`. Latin-1 makes it match byte for byte like `re` instead
+    # of treating invalid UTF-8 as unmatchable.
+    if re2 is not None and not flags & ~re.MULTILINE:
+        inline = "(?m)" if flags & re.MULTILINE else ""
+        options = re2.Options()
+        options.encoding = re2.Options.Encoding.LATIN1
+        try:
+            return re2.compile((inline + pattern).encode("ascii"), options)
+        except re2.error:
+            pass
+    return re.compile(pattern.encode("ascii"), flags)
+
+
+def fold_case(pattern: str) -> str:
+    # Lowercase the literal characters of a pattern, leaving escapes such as
+    # \S or \W untouched
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            parts.append(pattern[i : i + 2])
+            i += 2
+        else:
+            parts.append(pattern[i].lower())
+            i += 1
+    return "".join(parts)
+
+
+def fuse_patterns(patterns: List[str], flags: int = 0) -> "re.Pattern[bytes]":
+    # One alternation lets the regex engine test every pattern in a single
+    # pass. Patterns are case-folded, so variants such as "warning:" and
+    # "WARNING:" collapse into one alternative.
+    folded = dict.fromkeys(fold_case(p) for p in patterns)
+    return compile_bytes("|".join(f"(?:{p})" for p in folded), flags)
+
+
 # Regex patterns for detecting skipped tests
-# These patterns should match actual skipped test indicators, not summary counts
+# These patterns should match actual skipped test indicators, not summary counts.
+# They are searched across the whole log, so whitespace must not span newlines.
 SKIP_PATTERNS = [
-    r"\s+skipped\b",  # whitespace + "skipped" + word boundary
+    r"[^\S\n]+skipped\b",  # whitespace + "skipped" + word boundary
     r"SKIPPED\b",
-    r"\s+ignored\b",  # whitespace + "ignored" + word boundary
+    r"[^\S\n]+ignored\b",  # whitespace + "ignored" + word boundary
     r"\bpending\b",
     r"\bTODO\b",
     r"\[-\]",  # Some runners use [-] for skipped
     r"\bskip:",  # "skip:" at word boundary
     r"\bSkip:",
 ]
+SKIP_COMBINED = fuse_patterns(SKIP_PATTERNS, LINE_FLAGS)
 
 # Skip exclusion patterns (to avoid false positives from summary lines)
 SKIP_EXCLUDE_PATTERNS = [
@@ -48,6 +122,7 @@ SKIP_EXCLUDE_PATTERNS = [
     r"^=== RUN",  # Test run indicators should not be counted as skips (e.g., "=== RUN comments_are_ignored")
     r"\b0 pending\b",  # Busted summary line (e.g., "598 successes / 0 failures / 0 errors / 0 pending")
 ]
+SKIP_EXCLUDE_COMBINED = fuse_patterns(SKIP_EXCLUDE_PATTERNS, LINE_FLAGS)
 
 # Warning patterns for test/build output
 # Exclude common false positives like locale warnings
@@ -56,6 +131,7 @@ WARNING_PATTERNS = [
     r"WARNING:",
     r"Warning:",
 ]
+WARNING_COMBINED = fuse_patterns(WARNING_PATTERNS, LINE_FLAGS)
 
 # Patterns that should NOT be counted as warnings (false positives)
 # These include locale warnings and compiler warnings that aren't test failures
@@ -80,6 +156,7 @@ WARNING_EXCLUDE_PATTERNS = [
     # Node.js warnings
     r"localstorage-file",
 ]
+WARNING_EXCLUDE_COMBINED = fuse_patterns(WARNING_EXCLUDE_PATTERNS, LINE_FLAGS)
 
 # Semantic checks (filenames/patterns that must appear in output)
 # Multiple patterns per check for different test runners
@@ -101,6 +178,23 @@ SEMANTIC_CHECKS = {
     ],
 }
 
+
+def minimal_targets(targets: List[str]) -> Tuple[str, ...]:
+    # A target that contains another target of the same check can only match
+    # where the shorter one does too, so only the shorter one needs a scan.
+    unique = list(dict.fromkeys(targets))
+    return tuple(
+        target
+        for target in unique
+        if not any(other != target and other in target for other in unique)
+    )
+
+
+SEMANTIC_SCAN_TARGETS = {
+    key: tuple(target.encode("ascii") for target in minimal_targets(targets))
+    for key, targets in SEMANTIC_CHECKS.items()
+}
+
 # Test count patterns (Generic to Specific)
 TEST_PATTERNS = [
     r"(\d+) tests passed",
@@ -123,78 +217,334 @@ TEST_PATTERNS = [
 ]
 
 
+def required_literal(pattern: str) -> str:
+    # Longest run of plain characters that every match must contain. Only
+    # top-level characters count: groups, classes, {m,n} quantifiers and
+    # quantified characters may be skipped or repeated, so they end the
+    # current run.
+    best = run = ""
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        literal = ""
+        if char == "\\":
+            escaped = pattern[i + 1]
+            i += 2
+            if not escaped.isalnum():
+                literal = escaped
+        elif char == "[":
+            i += 2 if pattern[i + 1] == "^" else 1
+            if pattern[i] == "]":
+                i += 1
+            while pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+        elif char == "{":
+            close = pattern.find("}", i)
+            i = close + 1 if close != -1 else i + 1
+        else:
+            i += 1
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "|" and depth == 0:
+                return ""
+            elif char not in ".^$*+?}":
+                literal = char
+        if i < len(pattern) and pattern[i] in "*+?{":
+            literal = ""
+        if literal and depth == 0:
+            run += literal
+            best = max(best, run, key=len)
+        else:
+            run = ""
+    return best
+
+
+class GatedPattern:
+    # A compiled regex paired with the literal every match must contain.
+    # Logs without that literal are ruled out by a substring scan, which is
+    # far cheaper than a regex scan for patterns that start with "\d+".
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        self.regex = compile_bytes(pattern, flags)
+        self.literal = required_literal(pattern).encode("ascii")
+
+    def search(self, text: bytes) -> Optional["re.Match[bytes]"]:
+        if self.literal not in text:
+            return None
+        return self.regex.search(text)
+
+    def findall(self, text: bytes) -> List[Any]:
+        if self.literal not in text:
+            return []
+        return self.regex.findall(text)
+
+
+TEST_RES = tuple(GatedPattern(p) for p in TEST_PATTERNS)
+
+# Runner-specific fallbacks applied when no TEST_PATTERNS entry matches
+CTEST_RE = GatedPattern(r"\d+% tests passed, \d+ tests failed out of (\d+)")
+XCTEST_RE = GatedPattern(r"Executed (\d+) tests")
+GO_OK_RE = GatedPattern(r"^ok\s+", re.MULTILINE)
+RUN_RE = GatedPattern(r"=== RUN")
+
+# Stage delimiters written by `./strling audit <lang>`
+STAGE_MARKER_RE = compile_bytes(r"--- (SETUP|BUILD|TEST)(?: EXIT (\d+))? ---\n")
+TEST_MARKER = b"--- TEST ---\n"
+
+
 def load_toolchain():
     with open(TOOLCHAIN_PATH, "r") as f:
         return json.load(f)
 
 
-def run_command(cmd: str) -> Optional[subprocess.CompletedProcess[str]]:
+def load_setup_cache() -> Dict[str, str]:
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        return result
-    except Exception:
-        return None
+        with open(SETUP_CACHE_PATH, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
 
 
-def analyze_output(stdout: str, stderr: str) -> Tuple[int, int]:
-    skips = 0
-    warnings = 0
+def save_setup_cache(cache: Dict[str, str]) -> None:
+    with open(SETUP_CACHE_PATH, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
 
-    combined = stdout + "\n" + stderr
-    lines = combined.split("\n")
 
-    # Count skips per line, excluding false positives like "0 ignored"
-    for line in lines:
-        has_skip = False
-        for pattern in SKIP_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                has_skip = True
-                break
+def manifest_hash(binding_def: Dict[str, Any]) -> Optional[str]:
+    # Only bindings whose setup output survives `clean` list manifest_files;
+    # the setup command is hashed too so editing it re-runs setup.
+    manifest_files = binding_def.get("manifest_files", [])
+    if not manifest_files:
+        return None
+    digest = hashlib.sha256(json.dumps(binding_def.get("setup", [])).encode())
+    for name in manifest_files:
+        digest.update(name.encode() + b"\0")
+        try:
+            with open(os.path.join(binding_def["path"], name), "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def count_flagged_lines(
+    text: bytes, pattern: "re.Pattern[bytes]", exclude: "re.Pattern[bytes]"
+) -> int:
+    # Sweep the whole buffer; each line is counted at most once and is
+    # dropped when any exclusion pattern also matches within that line.
+    # The regex engine skips unflagged lines in C, so Python only runs per
+    # flagged line. A single line-anchored "^(?=...)(?!...)" regex counted
+    # with finditer was measured slower, since its lookaheads rescan every
+    # line of the log.
+    count = 0
+    pos = 0
+    while True:
+        match = pattern.search(text, pos)
+        if match is None:
+            return count
+        line_start = text.rfind(b"\n", 0, match.start()) + 1
+        line_end = text.find(b"\n", match.end())
+        if line_end == -1:
+            line_end = len(text)
+        if not exclude.search(text, line_start, line_end):
+            count += 1
+        pos = line_end + 1
+
+
+def analyze_output(text: bytes) -> Tuple[int, int]:
+    # ASCII lowercasing matches what IGNORECASE does for bytes patterns
+    text = text.lower()
 
-        if has_skip:
-            # Check if this skip should be excluded (e.g., "0 ignored" summary)
-            is_excluded = False
-            for exclude_pattern in SKIP_EXCLUDE_PATTERNS:
-                if re.search(exclude_pattern, line, re.IGNORECASE):
-                    is_excluded = True
-                    break
-            if not is_excluded:
-                skips += 1
-
-    # Count warnings per line, excluding false positives
-    for line in lines:
-        has_warning = False
-        for pattern in WARNING_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                has_warning = True
-                break
+    # Count skips per line, excluding false positives like "0 ignored"
+    skips = count_flagged_lines(text, SKIP_COMBINED, SKIP_EXCLUDE_COMBINED)
 
-        if has_warning:
-            # Check if this warning should be excluded (e.g., locale warnings)
-            is_excluded = False
-            for exclude_pattern in WARNING_EXCLUDE_PATTERNS:
-                if re.search(exclude_pattern, line, re.IGNORECASE):
-                    is_excluded = True
-                    break
-            if not is_excluded:
-                warnings += 1
+    # Count warnings per line, excluding false positives (e.g., locale warnings)
+    warnings = count_flagged_lines(text, WARNING_COMBINED, WARNING_EXCLUDE_COMBINED)
 
     return skips, warnings
 
 
-def check_semantic(stdout: str, stderr: str, check_key: str) -> bool:
+class LogScanner:
+    # Tallies skips and warnings while a command is still producing output.
+    # Both stdout and stderr readers feed the same scanner. In fail-fast mode
+    # (an `abort` event shared by all bindings) the command is stopped as soon
+    # as the verdict can no longer pass, or once another binding has failed.
+
+    def __init__(self, abort: Optional[threading.Event] = None) -> None:
+        self.skips = 0
+        self.warnings = 0
+        self.abort = abort
+        self.stopped = False
+        self.interrupted = False
+        self.process: Optional[subprocess.Popen[bytes]] = None
+        self._lock = threading.Lock()
+
+    def feed(self, text: bytes) -> None:
+        # Callers only pass whole lines so no line is split across two scans
+        skips, warnings = analyze_output(text)
+        with self._lock:
+            self.skips += skips
+            self.warnings += warnings
+            if (
+                self.abort is not None
+                and not self.stopped
+                and (self.skips or self.warnings)
+            ):
+                self.stopped = True
+                self.abort.set()
+                if self.process is not None:
+                    stop_process(self.process)
+
+
+def stop_process(proc: "subprocess.Popen[bytes]") -> None:
+    # ./strling is a shell script that only acts on SIGTERM once its current
+    # child exits, so signal the whole process group it leads instead.
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except (AttributeError, OSError):
+        proc.terminate()
+
+
+def drain_stream(
+    pipe: IO[bytes],
+    chunks: List[bytes],
+    scanner: Optional[LogScanner],
+    scan_after: Optional[bytes] = None,
+) -> None:
+    # Output stays as bytes (no UTF-8 decode); newlines are normalised the
+    # way text mode would, chunk by chunk so the scanner sees output as soon
+    # as the command emits it. A trailing "\r" is held back in case the
+    # matching "\n" arrives with the next read. With `scan_after`, only the
+    # output following that marker line is fed to the scanner.
+    pending = b""
+    held_cr = False
+    scanning = scan_after is None
+    with pipe:
+        for data in iter(lambda: pipe.read1(STREAM_CHUNK_SIZE), b""):
+            if held_cr:
+                data = b"\r" + data
+            held_cr = data.endswith(b"\r")
+            if held_cr:
+                data = data[:-1]
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            chunks.append(data)
+            if scanner is None:
+                continue
+            pending += data
+            cut = pending.rfind(b"\n") + 1
+            if not cut:
+                continue
+            block, pending = pending[:cut], pending[cut:]
+            if not scanning:
+                start = block.find(scan_after)
+                if start == -1:
+                    continue
+                scanning = True
+                block = block[start + len(scan_after) :]
+            scanner.feed(block)
+    if held_cr:
+        chunks.append(b"\n")
+        pending += b"\n"
+    if scanner is not None and scanning and pending:
+        scanner.feed(pending)
+
+
+def run_command(
+    cmd: List[str],
+    scanner: Optional[LogScanner] = None,
+    scan_after: Optional[bytes] = None,
+) -> Optional[subprocess.CompletedProcess[bytes]]:
+    # Exec the CLI directly (no intermediate /bin/sh) with default buffering.
+    # A fail-fast scanner may need to stop the command's whole process tree.
+    abort = scanner.abort if scanner is not None else None
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=abort is not None,
+        )
+    except Exception:
+        return None
+    if scanner is not None:
+        scanner.process = proc
+
+    # Drain both pipes concurrently so neither can fill up and stall the child
+    stdout_chunks: List[bytes] = []
+    stderr_chunks: List[bytes] = []
+    readers = [
+        threading.Thread(target=drain_stream, args=(pipe, chunks, scanner, scan_after))
+        for pipe, chunks in (
+            (proc.stdout, stdout_chunks),
+            (proc.stderr, stderr_chunks),
+        )
+    ]
+    for reader in readers:
+        reader.start()
+    if scanner is not None and abort is not None:
+        # Another binding failing stops this command too
+        while any(reader.is_alive() for reader in readers):
+            if abort.wait(ABORT_POLL_INTERVAL):
+                if not scanner.stopped:
+                    scanner.interrupted = True
+                    stop_process(proc)
+                break
+    for reader in readers:
+        reader.join()
+
+    return subprocess.CompletedProcess(
+        cmd, proc.wait(), b"".join(stdout_chunks), b"".join(stderr_chunks)
+    )
+
+
+def split_sections(text: bytes) -> Tuple[Dict[str, bytes], Dict[str, int]]:
+    sections: Dict[str, bytes] = {}
+    exit_codes: Dict[str, int] = {}
+    stage: Optional[str] = None
+    start = 0
+    for match in STAGE_MARKER_RE.finditer(text):
+        if stage is not None:
+            sections[stage] = text[start : match.start()]
+        name = match.group(1).decode("ascii").lower()
+        if match.group(2) is None:
+            stage = name
+            start = match.end()
+        else:
+            exit_codes[name] = int(match.group(2))
+            stage = None
+    if stage is not None:
+        sections[stage] = text[start:]
+    return sections, exit_codes
+
+
+def split_stages(
+    result: "subprocess.CompletedProcess[bytes]",
+) -> Dict[str, "subprocess.CompletedProcess[bytes]"]:
+    # `./strling audit <lang>` opens each stage with a marker on both streams
+    # and closes it with the stage's exit status on stdout. A stage that was
+    # cut short has no status line and takes the exit status of the command.
+    stdout_sections, exit_codes = split_sections(result.stdout)
+    stderr_sections, _ = split_sections(result.stderr)
+    return {
+        stage: subprocess.CompletedProcess(
+            result.args,
+            exit_codes.get(stage, result.returncode),
+            stdout,
+            stderr_sections.get(stage, b""),
+        )
+        for stage, stdout in stdout_sections.items()
+    }
+
+
+def check_semantic(combined: bytes, check_key: str) -> bool:
     # Check if the specific test file or case was mentioned in the output
     # This assumes runners print test names.
-    combined = stdout + "\n" + stderr
-
-    targets = SEMANTIC_CHECKS.get(check_key, [])
+    targets = SEMANTIC_SCAN_TARGETS.get(check_key, ())
     if not targets:
         return False
 
@@ -205,204 +555,295 @@ def check_semantic(stdout: str, stderr: str, check_key: str) -> bool:
     return False
 
 
-def main():
+def detect_test_count(combined: bytes) -> Union[str, int]:
+    test_count = "Unknown"
+    # Regex patterns for different runners
+    # 1. Generic "X tests passed"
+    # 2. Pytest: "==== 714 passed in 0.45s ===="
+    # 3. Jest: "Tests:       20 passed, 20 total"
+    # 4. Cargo (Rust): "test result: ok. 578 passed"
+    # 5. Maven (Java): "Tests run: 20, Failures: 0"
+    # 6. TAP (Perl): "Files=X, Tests=Y"
+    # 7. PHPUnit: "OK (X tests, Y assertions)" or "Tests: X"
+    # 8. R testthat: "[ FAIL 0 | WARN 0 | SKIP 0 | PASS X ]"
+    # 9. Dart: "+X: All tests passed!" or "X/Y tests passed"
+    # 10. .NET (dotnet test): "Passed:  X"
+    # 11. CTest: "100% tests passed"
+    # 12. Go: count "ok" lines
+    for pat in TEST_RES:
+        match = pat.search(combined)
+        if match:
+            test_count = match.group(1).decode("ascii")
+            break
+
+    # Special handling for CTest: "100% tests passed, 0 tests failed out of X"
+    if test_count == "Unknown":
+        ctest_match = CTEST_RE.search(combined)
+        if ctest_match:
+            test_count = ctest_match.group(1).decode("ascii")
+
+    # Special handling for XCTest (Swift): "Executed N tests"
+    # We take the maximum value found to capture the "All tests" aggregate
+    xctest_matches = XCTEST_RE.findall(combined)
+    if xctest_matches:
+        counts = [int(c) for c in xctest_matches]
+        max_count = max(counts)
+        if test_count == "Unknown" or (
+            test_count.isdigit() and int(test_count) < max_count
+        ):
+            test_count = str(max_count)
+
+    # Special handling for Go: count "ok" lines
+    if test_count == "Unknown":
+        go_ok_count = len(GO_OK_RE.findall(combined))
+        if go_ok_count > 0:
+            test_count = f"{go_ok_count} pkgs"
+
+    # Fallback: Count "=== RUN" lines
+    if test_count == "Unknown":
+        run_count = len(RUN_RE.findall(combined))
+        if run_count > 0:
+            test_count = run_count
+
+    return test_count
+
+
+def exit_on_signal(signum: int, frame: Any) -> None:
+    sys.exit(128 + signum)
+
+
+def not_run_result(lang: str) -> Dict[str, Any]:
+    return {
+        "binding": lang,
+        "build": "⏹ Not run",
+        "tests": 0,
+        "skips": "N/A",
+        "warnings": "N/A",
+        "dup_names": "N/A",
+        "ranges": "N/A",
+        "verdict": "⏹ NOT RUN (Fail-Fast)",
+    }
+
+
+def process_binding(
+    lang: str,
+    binding_def: Dict[str, Any],
+    abort: Optional[threading.Event] = None,
+    setup_cache: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    # With fail-fast enabled, `abort` is set once any binding has failed;
+    # bindings not yet started are skipped and running ones are stopped.
+    # `setup_cache` maps each binding to the manifest hash of its last
+    # successful setup, which is skipped while the hash still matches. A
+    # cached setup is only kept while the binding keeps passing, so setup
+    # output that went missing without a manifest change is rebuilt on the
+    # next audit.
+    if abort is not None and abort.is_set():
+        return not_run_result(lang)
+
+    log(f">> Processing {lang}...")
+
+    # Setup (to ensure clean build), build and test run back to back in a
+    # single CLI process. Skips and warnings are counted while the test
+    # output streams in.
+    setup_hash = manifest_hash(binding_def) if setup_cache is not None else None
+    setup_cached = setup_hash is not None and setup_cache.get(lang) == setup_hash
+    cmd = [STRLING_CLI, "audit", lang]
+    if setup_cached:
+        log(f">> Setup unchanged for {lang}, skipping")
+        cmd.append("--skip-setup")
+        setup_cache.pop(lang)
+
+    scanner = LogScanner(abort)
+    audit_res = run_command(cmd, scanner, TEST_MARKER)
+    if scanner.interrupted:
+        # Stopped because another binding failed, so the cached setup stands
+        if setup_cached:
+            setup_cache[lang] = setup_hash
+        return not_run_result(lang)
+    stages = split_stages(audit_res) if audit_res is not None else {}
+
+    setup_res = stages.get("setup")
+    if not setup_cached and (setup_res is None or setup_res.returncode != 0):
+        if setup_cache is not None:
+            setup_cache.pop(lang, None)
+        message = f"!! Setup failed for {lang}"
+        if setup_res:
+            stdout = setup_res.stdout.decode("utf-8", "replace")
+            stderr = setup_res.stderr.decode("utf-8", "replace")
+            message += f"\nSTDOUT: {stdout}\nSTDERR: {stderr}"
+        log(message)
+        return {
+            "binding": lang,
+            "build": "❌ Fail (Setup)",
+            "tests": 0,
+            "skips": "N/A",
+            "warnings": "N/A",
+            "dup_names": "N/A",
+            "ranges": "N/A",
+            "verdict": "🔴 FAIL",
+        }
+
+    if setup_cache is not None and setup_hash is not None and not setup_cached:
+        setup_cache[lang] = setup_hash
+    build_status = "✅ (cached)" if setup_cached else "✅"
+
+    # Build (if applicable)
+    # Check if 'build' command exists in toolchain for this language
+    has_build = bool(binding_def.get("build"))
+    if has_build:
+        build_res = stages.get("build")
+        if build_res is None or build_res.returncode != 0:
+            log(f"!! Build failed for {lang}")
+            return {
+                "binding": lang,
+                "build": "❌ Fail (Build)",
+                "tests": 0,
+                "skips": "N/A",
+                "warnings": "N/A",
+                "dup_names": "N/A",
+                "ranges": "N/A",
+                "verdict": "🔴 FAIL",
+            }
+
+    # Test
+    test_res = stages.get("test")
+    # duration = time.time() - start_time
+
+    if test_res is None:
+        log(f"!! Test execution failed for {lang}")
+        return {
+            "binding": lang,
+            "build": build_status,
+            "tests": 0,
+            "skips": "N/A",
+            "warnings": "N/A",
+            "dup_names": "N/A",
+            "ranges": "N/A",
+            "verdict": "🔴 FAIL (Exec)",
+        }
+
+    # Analyze
+    skips, warn_count = scanner.skips, scanner.warnings
+
+    # The semantic checks and the test count all read the same log
+    combined = test_res.stdout + b"\n" + test_res.stderr
+
+    # Semantic Checks
+    dup_names_verified = check_semantic(combined, "DupNames")
+    ranges_verified = check_semantic(combined, "Ranges")
+
+    # Verdict
+    verdict = CERTIFIED
+    if test_res.returncode != 0 and not scanner.stopped:
+        verdict = "🔴 FAIL (Exit Code)"
+    elif skips > 0:
+        verdict = "🔴 FAIL (Skips)"
+    elif warn_count > 0:
+        verdict = "🔴 FAIL (Warnings)"
+    elif not dup_names_verified or not ranges_verified:
+        verdict = "🔴 FAIL (Semantic)"
+
+    if setup_cached and verdict == CERTIFIED:
+        setup_cache[lang] = setup_hash
+
+    # Count tests
+    test_count = detect_test_count(combined)
+
+    return {
+        "binding": lang,
+        "build": build_status,
+        "tests": test_count,
+        "skips": "✅" if skips == 0 else f"❌ ({skips} Skip)",
+        "warnings": "✅" if warn_count == 0 else f"❌ ({warn_count} Warn)",
+        "dup_names": "✅ Verified" if dup_names_verified else "❓ Missing",
+        "ranges": "✅ Verified" if ranges_verified else "❓ Missing",
+        "verdict": verdict,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the Omega certification audit across all bindings."
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failing binding instead of auditing all of them",
+    )
+    parser.add_argument(
+        "--no-setup-cache",
+        action="store_true",
+        help="Run setup for every binding even if its manifests are unchanged",
+    )
+    args = parser.parse_args(argv)
+
     print(">> Starting Operation Omega: Final Ecosystem Coherency Audit")
 
     # 1. Environment Sterilization
     print(">> Step 1: Environment Sterilization (Global Clean)")
-    run_command(f"{STRLING_CLI} clean all")
+    run_command([STRLING_CLI, "clean", "all"])
 
     toolchain = load_toolchain()
     bindings = toolchain.get("bindings", {})
 
-    results: List[Dict[str, Any]] = []
-
     # 2. The Grand Execution
     print(">> Step 2: The Grand Execution")
 
-    for lang in bindings:
-        print(f">> Processing {lang}...")
-
-        # Setup (to ensure clean build)
-        # We run setup to install deps/configure
-        setup_res = run_command(f"{STRLING_CLI} setup {lang}")
-        if setup_res is None or setup_res.returncode != 0:
-            print(f"!! Setup failed for {lang}")
-            if setup_res:
-                print(f"STDOUT: {setup_res.stdout}")
-                print(f"STDERR: {setup_res.stderr}")
-            results.append(
-                {
-                    "binding": lang,
-                    "build": "❌ Fail (Setup)",
-                    "tests": 0,
-                    "skips": "N/A",
-                    "warnings": "N/A",
-                    "dup_names": "N/A",
-                    "ranges": "N/A",
-                    "verdict": "🔴 FAIL",
-                }
-            )
-            continue
-
-        # Build (if applicable)
-        # Check if 'build' command exists in toolchain for this language
-        # We can't easily check the json here without reloading or passing it down.
-        # But we have 'bindings' dict.
-        binding_def = bindings.get(lang, {})
-        if "build" in binding_def and binding_def["build"]:
-            print(f">> Building {lang}...")
-            build_res = run_command(f"{STRLING_CLI} build {lang}")
-            if build_res is None or build_res.returncode != 0:
-                print(f"!! Build failed for {lang}")
-                results.append(
-                    {
-                        "binding": lang,
-                        "build": "❌ Fail (Build)",
-                        "tests": 0,
-                        "skips": "N/A",
-                        "warnings": "N/A",
-                        "dup_names": "N/A",
-                        "ranges": "N/A",
-                        "verdict": "🔴 FAIL",
-                    }
-                )
-                continue
+    # Binding pipelines run concurrently; results keep toolchain order for
+    # the report. Setup may install system packages, whose managers allow
+    # only one install at a time, so the CLI serialises those installs.
+    abort = threading.Event() if args.fail_fast else None
+    setup_cache = None if args.no_setup_cache else load_setup_cache()
 
-        # Test
-        test_res = run_command(f"{STRLING_CLI} test {lang}")
-        # duration = time.time() - start_time
-
-        if test_res is None:
-            print(f"!! Test execution failed for {lang}")
-            results.append(
-                {
-                    "binding": lang,
-                    "build": "✅",
-                    "tests": 0,
-                    "skips": "N/A",
-                    "warnings": "N/A",
-                    "dup_names": "N/A",
-                    "ranges": "N/A",
-                    "verdict": "🔴 FAIL (Exec)",
-                }
-            )
-            continue
+    def run_binding(lang: str, binding_def: Dict[str, Any]) -> Dict[str, Any]:
+        result = process_binding(lang, binding_def, abort, setup_cache)
+        if abort is not None and result["verdict"] != CERTIFIED:
+            abort.set()
+        return result
 
-        # Analyze
-        skips, warn_count = analyze_output(test_res.stdout, test_res.stderr)
+    if abort is not None:
+        signal.signal(signal.SIGTERM, exit_on_signal)
 
-        # Semantic Checks
-        dup_names_verified = check_semantic(
-            test_res.stdout, test_res.stderr, "DupNames"
-        )
-        ranges_verified = check_semantic(test_res.stdout, test_res.stderr, "Ranges")
-
-        # Verdict
-        verdict = "🟢 CERTIFIED"
-        if test_res.returncode != 0:
-            verdict = "🔴 FAIL (Exit Code)"
-        elif skips > 0:
-            verdict = "🔴 FAIL (Skips)"
-        elif warn_count > 0:
-            verdict = "🔴 FAIL (Warnings)"
-        elif not dup_names_verified or not ranges_verified:
-            verdict = "🔴 FAIL (Semantic)"
-
-        # Count tests
-        test_count = "Unknown"
-        # Regex patterns for different runners
-        # 1. Generic "X tests passed"
-        # 2. Pytest: "==== 714 passed in 0.45s ===="
-        # 3. Jest: "Tests:       20 passed, 20 total"
-        # 4. Cargo (Rust): "test result: ok. 578 passed"
-        # 5. Maven (Java): "Tests run: 20, Failures: 0"
-        # 6. TAP (Perl): "Files=X, Tests=Y"
-        # 7. PHPUnit: "OK (X tests, Y assertions)" or "Tests: X"
-        # 8. R testthat: "[ FAIL 0 | WARN 0 | SKIP 0 | PASS X ]"
-        # 9. Dart: "+X: All tests passed!" or "X/Y tests passed"
-        # 10. .NET (dotnet test): "Passed:  X"
-        # 11. CTest: "100% tests passed"
-        # 12. Go: count "ok" lines
-        combined = test_res.stdout + "\n" + test_res.stderr
-
-        for pat in TEST_PATTERNS:
-            match = re.search(pat, combined)
-            if match:
-                test_count = match.group(1)
-                break
-
-        # Special handling for CTest: "100% tests passed, 0 tests failed out of X"
-        if test_count == "Unknown":
-            ctest_match = re.search(
-                r"\d+% tests passed, \d+ tests failed out of (\d+)", combined
+    workers = max(1, min(os.cpu_count() or 1, len(bindings)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            results: List[Dict[str, Any]] = list(
+                executor.map(run_binding, bindings.keys(), bindings.values())
             )
-            if ctest_match:
-                test_count = ctest_match.group(1)
-
-        # Special handling for XCTest (Swift): "Executed N tests"
-        # We take the maximum value found to capture the "All tests" aggregate
-        xctest_matches = re.findall(r"Executed (\d+) tests", combined)
-        if xctest_matches:
-            counts = [int(c) for c in xctest_matches]
-            max_count = max(counts)
-            if test_count == "Unknown" or (
-                test_count.isdigit() and int(test_count) < max_count
-            ):
-                test_count = str(max_count)
-
-        # Special handling for Go: count "ok" lines
-        if test_count == "Unknown":
-            go_ok_count = len(re.findall(r"^ok\s+", combined, re.MULTILINE))
-            if go_ok_count > 0:
-                test_count = f"{go_ok_count} pkgs"
-
-        # Fallback: Count "=== RUN" lines
-        if test_count == "Unknown":
-            run_count = len(re.findall(r"=== RUN", combined))
-            if run_count > 0:
-                test_count = run_count
-
-        results.append(
-            {
-                "binding": lang,
-                "build": "✅",
-                "tests": test_count,
-                "skips": "✅" if skips == 0 else f"❌ ({skips} Skip)",
-                "warnings": "✅" if warn_count == 0 else f"❌ ({warn_count} Warn)",
-                "dup_names": "✅ Verified" if dup_names_verified else "❓ Missing",
-                "ranges": "✅ Verified" if ranges_verified else "❓ Missing",
-                "verdict": verdict,
-            }
-        )
+        except BaseException:
+            # Fail-fast commands run in their own session, so a Ctrl-C or
+            # SIGTERM never reaches them; stop them before the pool waits
+            # on their workers.
+            if abort is not None:
+                abort.set()
+            raise
+
+    if setup_cache is not None:
+        save_setup_cache(setup_cache)
 
     # 3. Report Generation
     print(">> Step 3: Generating Report")
 
     os.makedirs(os.path.dirname(REPORT_PATH), exist_ok=True)
 
-    with open(REPORT_PATH, "w") as f:
-        f.write("# Final Audit Report\n\n")
-        f.write(
-            "| Binding | Build | Tests | Zero Skips | Zero Warnings | Semantic: DupNames | Semantic: Ranges | Verdict |\n"
-        )
-        f.write("| :--- | :---: | :---: | :---: | :---: | :---: | :---: | :---: |\n")
+    parts = [
+        "# Final Audit Report\n\n",
+        "| Binding | Build | Tests | Zero Skips | Zero Warnings | Semantic: DupNames | Semantic: Ranges | Verdict |\n",
+        "| :--- | :---: | :---: | :---: | :---: | :---: | :---: | :---: |\n",
+    ]
+    parts.extend(
+        f"| {r['binding']} | {r['build']} | {r['tests']} | {r['skips']} | {r['warnings']} | {r['dup_names']} | {r['ranges']} | {r['verdict']} |\n"
+        for r in results
+    )
 
-        for r in results:
-            f.write(
-                f"| {r['binding']} | {r['build']} | {r['tests']} | {r['skips']} | {r['warnings']} | {r['dup_names']} | {r['ranges']} | {r['verdict']} |\n"
-            )
+    with open(REPORT_PATH, "w") as f:
+        f.write("".join(parts))
 
     print(f">> Audit Complete. Report saved to {REPORT_PATH}")
 
     # Check for failures
-    certification_passed = True
-    for r in results:
-        if r["verdict"] != "🟢 CERTIFIED":
-            certification_passed = False
-            break
-
-    if not certification_passed:
+    if any(r["verdict"] != CERTIFIED for r in results):
         print_instructional_failure()
         sys.exit(1)
 
@@ -0,0 +1,282 @@
+import json
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+import tooling.audit_omega as audit_omega
+from tooling.audit_omega import (
+    TEST_RES,
+    LogScanner,
+    analyze_output,
+    check_semantic,
+    compile_bytes,
+    detect_test_count,
+    fold_case,
+    manifest_hash,
+    minimal_targets,
+    process_binding,
+    required_literal,
+    run_command,
+    split_stages,
+)
+
+
+def test_analyze_output_counts_skips_and_warnings():
+    stdout = b"test_a ... ok\ntest_b ... skipped\ntest_c SKIPPED\n"
+    stderr = b"warning: something odd\n"
+    assert analyze_output(stdout + b"\n" + stderr) == (2, 1)
+
+
+def test_analyze_output_ignores_summary_and_excluded_lines():
+    stdout = (
+        b"test result: ok. 578 passed; 0 failed; 0 ignored\n"
+        b"> Task :checkKotlinGradlePluginConfigurationErrors SKIPPED\n"
+        b"=== RUN   comments_are_ignored\n"
+        b"598 successes / 0 failures / 0 errors / 0 pending\n"
+    )
+    stderr = b"perl: warning: Setting locale failed.\nwarning: unused variable `x`\n"
+    assert analyze_output(stdout + b"\n" + stderr) == (0, 0)
+
+
+def test_analyze_output_counts_each_line_once():
+    assert analyze_output(b"skipped TODO pending [-]\n x skipped") == (2, 0)
+
+
+def test_check_semantic_matches_any_target():
+    assert check_semantic(b"ok semantic_duplicates.json", "DupNames")
+    assert check_semantic(b"test_semantic_ranges passed", "Ranges")
+    assert not check_semantic(b"nothing here", "Ranges")
+    assert not check_semantic(b"DupNames", "Unknown")
+
+
+def test_analyze_output_is_case_insensitive():
+    assert analyze_output(b"a Skipped\nb IGNORED\nc Todo\nWaRnInG: x") == (3, 1)
+    assert analyze_output(b"warning: LC_ALL unset\n=== run x ignored") == (0, 0)
+
+
+def test_analyze_output_matches_non_utf8_bytes():
+    # Holds for both `re` and the optional google-re2 engine
+    assert analyze_output(b"> Task :\xe9\xff SKIPPED\n") == (0, 0)
+    assert analyze_output(b"\xff\xfe test skipped\n") == (1, 0)
+
+
+def test_fold_case_keeps_escapes():
+    assert fold_case(r"[^\S\n]+SKIPPED\b") == r"[^\S\n]+skipped\b"
+    assert fold_case(r"\bTODO\W") == r"\btodo\W"
+
+
+def test_analyze_output_keeps_matches_within_a_line():
+    # "ignored" only counts after whitespace on the same line
+    assert analyze_output(b"comments are\nignored") == (0, 0)
+    # exclusions only apply to the line that carries the skip marker
+    assert analyze_output(b"0 skipped\n test skipped") == (1, 0)
+    assert analyze_output(b"=== RUN   a_is_ignored\nb is ignored") == (1, 0)
+
+
+def test_run_command_streams_output_into_scanner():
+    scanner = LogScanner()
+    result = run_command(
+        ["sh", "-c", "printf 'a skipped\\r\\nok\\r'; printf 'warning: x' >&2; exit 3"],
+        scanner,
+    )
+    assert result is not None
+    assert result.returncode == 3
+    assert result.stdout == b"a skipped\nok\n"
+    assert result.stderr == b"warning: x"
+    assert (scanner.skips, scanner.warnings) == (1, 1)
+
+
+def test_run_command_fail_fast_stops_on_first_skip():
+    scanner = LogScanner(threading.Event())
+    result = run_command(["sh", "-c", "echo 'a skipped'; sleep 30; echo done"], scanner)
+    assert result is not None
+    assert scanner.stopped
+    assert scanner.skips == 1
+    assert scanner.abort.is_set()
+    assert b"done" not in result.stdout
+
+
+def test_run_command_fail_fast_stops_when_another_binding_fails():
+    abort = threading.Event()
+    scanner = LogScanner(abort)
+    threading.Timer(0.2, abort.set).start()
+    result = run_command(["sh", "-c", "echo start; sleep 30; echo done"], scanner)
+    assert result is not None
+    assert scanner.interrupted and not scanner.stopped
+    assert b"done" not in result.stdout
+
+
+def test_run_command_only_scans_after_marker():
+    scanner = LogScanner()
+    script = (
+        "echo 'setup skipped'; echo 'warning: a' >&2; "
+        "echo '--- TEST ---'; printf 'b --- TEST ---\\n' >&2; "
+        "echo 'c skipped'; echo 'warning: d' >&2"
+    )
+    result = run_command(["sh", "-c", script], scanner, b"--- TEST ---\n")
+    assert result is not None
+    assert (scanner.skips, scanner.warnings) == (1, 1)
+
+
+def test_split_stages_attributes_output_per_stage():
+    result = subprocess.CompletedProcess(
+        ["./strling", "audit", "c"],
+        1,
+        b"--- SETUP ---\nok\n--- SETUP EXIT 0 ---\n"
+        b"--- TEST ---\n3 tests passed\n--- TEST EXIT 1 ---\n",
+        b"--- SETUP ---\nnote\n--- TEST ---\nboom",
+    )
+    stages = split_stages(result)
+    assert list(stages) == ["setup", "test"]
+    assert stages["setup"].returncode == 0
+    assert (stages["setup"].stdout, stages["setup"].stderr) == (b"ok\n", b"note\n")
+    assert stages["test"].returncode == 1
+    assert (stages["test"].stdout, stages["test"].stderr) == (
+        b"3 tests passed\n",
+        b"boom",
+    )
+
+
+def test_split_stages_uses_command_status_for_interrupted_stage():
+    result = subprocess.CompletedProcess(
+        [], -15, b"--- SETUP ---\n--- SETUP EXIT 0 ---\n--- TEST ---\nrunning", b""
+    )
+    assert split_stages(result)["test"].returncode == -15
+
+
+def test_run_command_reports_missing_executable():
+    assert run_command(["./definitely-not-a-strling-cli"]) is None
+
+
+def test_minimal_targets_drops_targets_containing_shorter_ones():
+    assert minimal_targets(
+        ["test_semantic_ranges", "semantic_ranges", "Ranges", "semantic_ranges.json"]
+    ) == ("semantic_ranges", "Ranges")
+    assert minimal_targets(["dup", "dup"]) == ("dup",)
+
+
+def test_required_literal_only_keeps_mandatory_text():
+    assert required_literal(r"(\d+) tests passed") == " tests passed"
+    assert required_literal(r"OK \((\d+) tests?[,\)]") == " test"
+    assert required_literal(r"Files=\d+, Tests=(\d+)") == ", Tests="
+    assert required_literal(r"skip|pass") == ""
+    assert required_literal(r"a{2,3}b") == "b"
+    assert required_literal(r"x{2}yz") == "yz"
+
+
+TEST_PATTERN_SAMPLES = [
+    b"12 tests passed",
+    b"==== 714 passed in 0.45s ====",
+    b"Tests:       20 passed, 20 total",
+    b"Tests:       20 passed, 20 total",
+    b"Executed 5 tests, with 0 failures",
+    b"[STRling Audit] Tests: 9, Skipped: 0",
+    b"test result: ok. 578 passed; 0 failed",
+    b"Tests run: 20, Failures: 0",
+    b"Files=3, Tests=40",
+    b"OK (5 tests, 9 assertions)",
+    b"Tests: 7",
+    b"[ FAIL 0 | WARN 0 | SKIP 0 | PASS 31 ]",
+    b"598 successes / 0 failures / 0 errors / 0 pending",
+    b"10 runs, 20 assertions",
+    b"+8: All tests passed!",
+    b"3/3 tests passed",
+    b"Passed:  4",
+]
+
+
+def test_test_pattern_gates_are_part_of_every_match():
+    assert len(TEST_PATTERN_SAMPLES) == len(TEST_RES)
+    for gated, sample in zip(TEST_RES, TEST_PATTERN_SAMPLES):
+        match = gated.regex.search(sample)
+        assert match is not None, gated.regex.pattern
+        assert gated.literal in match.group(0), gated.regex.pattern
+        assert gated.search(sample) is not None
+
+
+def test_detect_test_count_by_runner():
+    assert detect_test_count(b"==== 714 passed in 0.45s ====") == "714"
+    assert detect_test_count(b"test result: ok. 578 passed; 0 failed") == "578"
+    assert detect_test_count(b"100% tests passed, 0 tests failed out of 7") == "7"
+    assert detect_test_count(b"Executed 3 tests\nExecuted 12 tests") == "12"
+    assert detect_test_count(b"ok  pkg/a\nok  pkg/b\n") == "2 pkgs"
+    assert detect_test_count(b"=== RUN a\n=== RUN b") == 2
+    assert detect_test_count(b"nothing to see") == "Unknown"
+
+
+def test_manifest_hash_tracks_manifest_contents(tmp_path):
+    (tmp_path / "requirements.txt").write_text("pytest\n")
+    binding = {
+        "path": str(tmp_path),
+        "setup": ["pip", "install", "-r", "requirements.txt"],
+        "manifest_files": ["requirements.txt"],
+    }
+    first = manifest_hash(binding)
+    assert first is not None and manifest_hash(binding) == first
+    (tmp_path / "requirements.txt").write_text("pytest\nblack\n")
+    assert manifest_hash(binding) != first
+    changed = manifest_hash(binding)
+    assert manifest_hash({**binding, "setup": ["pip", "install", "."]}) != changed
+    assert manifest_hash({"path": str(tmp_path), "setup": ["x"]}) is None
+
+
+def test_compile_bytes_keeps_multiline_anchors():
+    # Holds for both `re` and the optional google-re2 engine
+    pattern = compile_bytes(r"^ok\s+", re.MULTILINE)
+    assert pattern.findall(b"ok a\nnot ok b\nok c") == [b"ok ", b"ok "]
+    assert pattern.search(b"xx\nok a", 1, 4) is None
+    assert pattern.search(b"xx\nok a", 3).start() == 3
+
+
+def test_process_binding_drops_cached_setup_that_stops_passing(tmp_path, monkeypatch):
+    # The fake CLI's test stage fails whenever setup was skipped
+    cli = tmp_path / "strling"
+    cli.write_text(
+        "#!/bin/sh\n"
+        'echo "--- SETUP ---"; echo "--- SETUP ---" >&2\n'
+        'echo "--- SETUP EXIT 0 ---"\n'
+        'echo "--- TEST ---"; echo "--- TEST ---" >&2\n'
+        '[ "$3" = "--skip-setup" ] && { echo "--- TEST EXIT 1 ---"; exit 1; }\n'
+        'echo "--- TEST EXIT 0 ---"\n'
+    )
+    cli.chmod(0o755)
+    (tmp_path / "requirements.txt").write_text("pytest\n")
+    monkeypatch.setattr(audit_omega, "STRLING_CLI", str(cli))
+    binding = {
+        "path": str(tmp_path),
+        "setup": ["pip", "install"],
+        "manifest_files": ["requirements.txt"],
+    }
+    cache = {}
+
+    assert process_binding("py", binding, setup_cache=cache)["build"] == "✅"
+    assert cache == {"py": manifest_hash(binding)}
+    cached = process_binding("py", binding, setup_cache=cache)
+    assert cached["build"] == "✅ (cached)"
+    assert cached["verdict"] == "🔴 FAIL (Exit Code)"
+    assert cache == {}
+
+
+def test_process_binding_keeps_cached_setup_when_interrupted(tmp_path, monkeypatch):
+    cli = tmp_path / "strling"
+    cli.write_text('#!/bin/sh\necho "--- TEST ---"; sleep 30\n')
+    cli.chmod(0o755)
+    (tmp_path / "go.mod").write_text("module strling\n")
+    monkeypatch.setattr(audit_omega, "STRLING_CLI", str(cli))
+    binding = {"path": str(tmp_path), "setup": ["go"], "manifest_files": ["go.mod"]}
+    cache = {"go": manifest_hash(binding)}
+    abort = threading.Event()
+    threading.Timer(0.2, abort.set).start()
+
+    result = process_binding("go", binding, abort, cache)
+    assert result["verdict"] == "⏹ NOT RUN (Fail-Fast)"
+    assert cache == {"go": manifest_hash(binding)}
+
+
+def test_toolchain_manifest_files_exist():
+    root = Path(__file__).resolve().parents[2]
+    bindings = json.loads((root / "toolchain.json").read_text())["bindings"]
+    for lang, binding in bindings.items():
+        for name in binding.get("manifest_files", []):
+            assert (root / binding["path"] / name).is_file(), (lang, name)